@@ -10,12 +10,23 @@ Options:
   --wipe-output-file     Replace existing output file instead of merging
   --selective            Review and approve each level individually
   --skip-invalid-facts   Skip facts with missing fields (default: interactive resolution)
+  --sqlite [db_file]     Also export the converted data to a SQLite database (see query_data.py)
+  --workers [N]          Map facts of large levels in N worker processes (requires --skip-invalid-facts)
+  --diagnostics [file]   Stream every warning to an NDJSON diagnostics file
 """
 
 import json
+import math
+import os
+import re
+import shutil
+import sqlite3
 import sys
+import tempfile
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
+from fractions import Fraction
 
 # ANSI color codes for terminal output
 class Colors:
@@ -36,15 +47,74 @@ ESSENTIAL_FACT_FIELDS = ['index', 'result', 'expression']
 OPTIONAL_LEVEL_FIELDS = ['objective', 'standards', 'mastery', 'difficulty']
 OPTIONAL_FACT_FIELDS = ['prompt', 'asking_for', 'type', 'operands', 'operator']
 
+# Parallel fact mapping: only levels with at least this many facts are split
+# across workers, in chunks of at least PARALLEL_MIN_CHUNK facts
+PARALLEL_MIN_FACTS = 5000
+PARALLEL_MIN_CHUNK = 1000
+
+# Level being mapped by this worker process (set by init_parallel_worker)
+parallel_job = None
+
+# Warnings are aggregated so memory stays constant whatever the error rate:
+# counts per (level, reason, field) plus a few sample records per reason
+WARNING_SAMPLE_SIZE = 10
+
 # Statistics tracking
 stats = {
     'levels_processed': 0,
     'facts_processed': 0,
     'facts_skipped': 0,
-    'warnings': [],
+    'results_normalized': 0,
+    'warning_counts': {},
+    'warning_samples': {},
     'field_mappings': {}
 }
 
+# Open NDJSON stream receiving every warning record (set by --diagnostics)
+diagnostics_stream = None
+
+def record_warning(level_context, fact_number, reason, field=None, detail=None, diagnostics=None):
+    """Count a warning and keep it as a sample if there's room for its reason.
+    
+    When a diagnostics stream is given, the full record is also written to it.
+    """
+    key = (level_context, reason, field)
+    stats['warning_counts'][key] = stats['warning_counts'].get(key, 0) + 1
+    
+    samples = stats['warning_samples'].setdefault(reason, [])
+    if len(samples) >= WARNING_SAMPLE_SIZE and diagnostics is None:
+        return
+    
+    record = {'level': level_context, 'fact': fact_number, 'reason': reason, 'field': field, 'detail': detail}
+    if len(samples) < WARNING_SAMPLE_SIZE:
+        samples.append(record)
+    if diagnostics is not None:
+        diagnostics.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def format_warning(record):
+    """Format a warning record for the report."""
+    prefix = f"Level '{record['level']}' fact #{record['fact']}"
+    reason = record['reason']
+    if reason == 'missing_field':
+        return f"{prefix}: Missing essential field '{record['field']}'"
+    if reason == 'user_skipped':
+        return f"{prefix}: User skipped - missing '{record['field']}'"
+    if reason == 'error':
+        return f"{prefix}: Error processing - {record['detail']}"
+    if reason == 'user_skipped_error':
+        return f"{prefix}: User skipped - error: {record['detail']}"
+    if reason == 'unparsed_result':
+        return f"{prefix}: Could not normalize result - {record['detail']}"
+    return f"{prefix}: {reason}"
+
+def merge_warnings(chunk_counts, chunk_samples):
+    """Merge warning counts and samples collected elsewhere (e.g. a worker) into stats."""
+    for key, count in chunk_counts.items():
+        stats['warning_counts'][key] = stats['warning_counts'].get(key, 0) + count
+    for reason, records in chunk_samples.items():
+        samples = stats['warning_samples'].setdefault(reason, [])
+        samples.extend(records[:WARNING_SAMPLE_SIZE - len(samples)])
+
 def similarity(a, b):
     """Calculate similarity ratio between two strings."""
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
@@ -173,7 +243,173 @@ def prompt_for_optional_fields(available_fields, context="level"):
         print(f"   {Colors.WARNING}Invalid input. Skipping optional fields.{Colors.ENDC}")
         return []
 
-def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_invalid=False, use_metadata=False, fact_index=None):
+# Result strings like "4", "-3", "1/2", "10/9", "2 1/2" or "0.75"
+RESULT_PATTERN = re.compile(r'^(-)?(?:(\d+)\s+)?(\d+)(?:/(\d+)|\.(\d+))?$')
+
+# Fields that hold parts of an answer; 'result' is built from these, never mapped onto one
+SPLIT_RESULT_FIELDS = [
+    'result_whole', 'result_fraction_numerator', 'result_fraction_denominator',
+    'result_numerator', 'result_denominator', 'result_decimal', 'result_text', 'result_mixed',
+]
+
+# Answers that are legitimately not numbers (comparison facts)
+NON_NUMERIC_RESULTS = {'<', '>', '=', '≤', '≥'}
+
+def build_canonical_result(whole, numerator, denominator, negative=False):
+    """Build the canonical result dict from an as-written mixed number.
+    
+    whole, numerator and denominator are never negative; the sign is carried only
+    by 'negative' (so -2 1/2 is whole=2, numerator=1, denominator=2, negative=True).
+    numerator/denominator keep the written form (so 2/4 stays 2/4 for equivalence
+    facts) and 'reduced' tells whether that fraction part is in lowest terms.
+    reduced_numerator/reduced_denominator give the magnitude as an improper
+    fraction in lowest terms, so equal answers ("10/9", "1 1/9") compare exactly
+    on (negative, reduced_numerator, reduced_denominator). 'value' is the signed
+    value as a float, for display and range queries.
+    Raises ValueError for negative parts or a non-positive denominator.
+    """
+    if denominator <= 0:
+        raise ValueError(f"invalid denominator {denominator}")
+    if whole < 0 or numerator < 0:
+        raise ValueError("negative parts must use the negative flag")
+    magnitude = whole + Fraction(numerator, denominator)
+    negative = negative and magnitude != 0
+    return {
+        'whole': whole,
+        'numerator': numerator,
+        'denominator': denominator,
+        'negative': negative,
+        'reduced': math.gcd(numerator, denominator) == 1 if numerator else denominator == 1,
+        'reduced_numerator': magnitude.numerator,
+        'reduced_denominator': magnitude.denominator,
+        'value': float(-magnitude if negative else magnitude),
+    }
+
+def canonical_from_fraction(value):
+    """Build the canonical result for an exact rational (ints, decimals)."""
+    whole = int(abs(value))
+    fraction_part = abs(value) - whole
+    return build_canonical_result(whole, fraction_part.numerator, fraction_part.denominator, value < 0)
+
+def canonical_from_signed(whole, numerator, denominator):
+    """Build the canonical result from split fields whose sign may sit on any part."""
+    negative = whole < 0 or numerator < 0
+    return build_canonical_result(abs(whole), abs(numerator), denominator, negative)
+
+def parse_result_string(text):
+    """Parse a result string into the canonical form.
+    
+    Returns None for comparison answers like '<'; raises ValueError for anything
+    else that isn't a number, fraction, mixed number or decimal.
+    """
+    text = text.strip()
+    if text in NON_NUMERIC_RESULTS:
+        return None
+    match = RESULT_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"unrecognized result {text!r}")
+    sign, whole, first, denominator, decimals = match.groups()
+    if decimals is not None:
+        if whole is not None:
+            raise ValueError(f"invalid mixed number {text!r}")
+        return canonical_from_fraction(Fraction(f"{sign or ''}{first}.{decimals}"))
+    if denominator is not None:
+        return build_canonical_result(int(whole or 0), int(first), int(denominator), sign is not None)
+    if whole is not None:
+        raise ValueError(f"mixed number without a fraction {text!r}")
+    return build_canonical_result(int(first), 0, 1, sign is not None)
+
+def format_result(canonical):
+    """Format a canonical result the way results are written in the banks ("2 1/2", "3/8", 7)."""
+    if canonical['numerator'] == 0:
+        return -canonical['whole'] if canonical['negative'] else canonical['whole']
+    sign = '-' if canonical['negative'] else ''
+    whole = f"{canonical['whole']} " if canonical['whole'] else ''
+    return f"{sign}{whole}{canonical['numerator']}/{canonical['denominator']}"
+
+def result_from_split_fields(fact_data):
+    """Build a (result, canonical_result) pair for facts whose answer sits in split fields.
+    
+    Sources are tried in order: split mixed-number fields (result_whole/
+    result_fraction_*), split improper fields (result_numerator/result_denominator),
+    result_decimal, a lone result_numerator or result_denominator (missing-part
+    equivalence facts, where the answer is that single number), then numerator/
+    denominator of decompose_unit facts (checked against their decomposition).
+    Returns None when there are no split fields; raises ValueError when they're invalid.
+    """
+    def as_int(key):
+        value = fact_data.get(key)
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and re.fullmatch(r'-?\d+', value.strip()):
+            return int(value)
+        return None
+    
+    whole = as_int('result_whole')
+    fraction_numerator = as_int('result_fraction_numerator')
+    fraction_denominator = as_int('result_fraction_denominator')
+    if None not in (whole, fraction_numerator, fraction_denominator):
+        canonical = canonical_from_signed(whole, fraction_numerator, fraction_denominator)
+        return format_result(canonical), canonical
+    
+    numerator = as_int('result_numerator')
+    denominator = as_int('result_denominator')
+    if numerator is not None and denominator is not None:
+        canonical = canonical_from_signed(0, numerator, denominator)
+        return format_result(canonical), canonical
+    
+    decimal = fact_data.get('result_decimal')
+    if isinstance(decimal, (str, int, float)) and not isinstance(decimal, bool):
+        canonical = normalize_result({}, decimal)
+        if canonical is None:
+            raise ValueError(f"non-numeric result_decimal {decimal!r}")
+        return decimal, canonical
+    
+    missing_part = numerator if numerator is not None else denominator
+    if missing_part is not None:
+        canonical = canonical_from_signed(missing_part, 0, 1)
+        return format_result(canonical), canonical
+    
+    if fact_data.get('operator') == 'decompose_unit':
+        fraction_numerator = as_int('numerator')
+        fraction_denominator = as_int('denominator')
+        if fraction_numerator is None or fraction_denominator is None:
+            raise ValueError("decompose_unit fact without numerator/denominator")
+        canonical = canonical_from_signed(0, fraction_numerator, fraction_denominator)
+        decomposition = fact_data.get('decomposition')
+        if isinstance(decomposition, list):
+            total = sum(Fraction(part['numerator'], part['denominator']) for part in decomposition)
+            if total != Fraction(fraction_numerator, fraction_denominator):
+                raise ValueError(f"decomposition sums to {total}, not {fraction_numerator}/{fraction_denominator}")
+        return format_result(canonical), canonical
+    
+    return None
+
+def normalize_result(fact_data, result):
+    """Parse a fact's result once into a canonical structured form.
+    
+    The mapped result value is used when present; otherwise the answer is built
+    from split fields (see result_from_split_fields). Returns None for comparison
+    answers such as '<' or '>' and for list answers (e.g. multiples); raises
+    ValueError when a result can't be parsed or no source holds one.
+    """
+    if isinstance(result, (int, float)) and not isinstance(result, bool):
+        if not math.isfinite(result):
+            raise ValueError(f"non-finite result {result!r}")
+        return canonical_from_fraction(Fraction(str(result)))
+    if isinstance(result, str) and result.strip():
+        return parse_result_string(result)
+    if isinstance(result, list):
+        return None
+    
+    split = result_from_split_fields(fact_data)
+    if split is None:
+        raise ValueError("no result value found")
+    return split[1]
+
+def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_invalid=False, use_metadata=False, fact_index=None, diagnostics=None):
     """Map a single fact to the target format."""
     try:
         # If using metadata field, extract it as the source
@@ -184,6 +420,7 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
         
         target_fact = {}
         missing_fields = []
+        canonical_result = None
         
         # First, handle index (to ensure it's first in order)
         index_mapped_key = field_mapping.get('index', 'index')
@@ -222,15 +459,24 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
                 # Essential field missing (unless it's auto-generated)
                 if mapped_key is not None:  # Only report missing if not auto-generated
                     missing_fields.append(essential_field)
+            
+            # Answers held only in split fields (CCSS/QTI) fill 'result' before the check
+            if essential_field == 'result' and target_fact.get('result') in (None, ''):
+                try:
+                    split = result_from_split_fields(fact_data)
+                except (ValueError, ZeroDivisionError, OverflowError, KeyError, TypeError):
+                    split = None  # Reported as unparsed_result or missing 'result' below
+                if split:
+                    target_fact['result'], canonical_result = split
+                    if 'result' in missing_fields:
+                        missing_fields.remove('result')
         
         # If there are missing fields, handle interactively or skip
         if missing_fields:
             if skip_invalid:
                 # Just log and skip
                 for field in missing_fields:
-                    stats['warnings'].append(
-                        f"Level '{level_context}' fact #{source_fact.get('index', '?')}: Missing essential field '{field}'"
-                    )
+                    record_warning(level_context, source_fact.get('index', '?'), 'missing_field', field, diagnostics=diagnostics)
                 return None
             else:
                 # Interactive resolution
@@ -244,10 +490,13 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
                     print(f"      • {key}: {value_str}")
                 
                 available_keys = list(fact_data.keys())
+                result_keys = [k for k in available_keys if k not in SPLIT_RESULT_FIELDS]
                 
                 # Try to map each missing field
                 for missing_field in missing_fields:
-                    mapped = prompt_user_for_field(missing_field, available_keys, f"fact #{fact_data.get('index', '?')}")
+                    # Never map 'result' onto a split field; that would override real results of later facts
+                    candidate_keys = result_keys if missing_field == 'result' else available_keys
+                    mapped = prompt_user_for_field(missing_field, candidate_keys, f"fact #{fact_data.get('index', '?')}")
                     if mapped:
                         field_mapping[missing_field] = mapped
                         target_fact[missing_field] = fact_data[mapped]
@@ -258,9 +507,7 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
                         while True:
                             response = input(f"\n   Skip this fact? (y/n): ").strip().lower()
                             if response in ['y', 'yes']:
-                                stats['warnings'].append(
-                                    f"Level '{level_context}' fact #{fact_data.get('index', '?')}: User skipped - missing '{missing_field}'"
-                                )
+                                record_warning(level_context, fact_data.get('index', '?'), 'user_skipped', missing_field, diagnostics=diagnostics)
                                 return None
                             elif response in ['n', 'no']:
                                 print(f"   {Colors.FAIL}Cannot proceed without '{missing_field}'. Aborting conversion.{Colors.ENDC}")
@@ -275,23 +522,30 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
             elif opt_field in field_mapping and field_mapping[opt_field] in fact_data:
                 target_fact[opt_field] = fact_data[field_mapping[opt_field]]
         
+        # Parse the result once so the game can compare answers without string parsing
+        try:
+            if canonical_result is None:
+                canonical_result = normalize_result(fact_data, target_fact.get('result'))
+        except (ValueError, ZeroDivisionError, OverflowError, KeyError, TypeError) as e:
+            canonical_result = None
+            record_warning(level_context, fact_data.get('index', '?'), 'unparsed_result', 'result', detail=str(e), diagnostics=diagnostics)
+        if canonical_result:
+            target_fact['canonical_result'] = canonical_result
+            stats['results_normalized'] += 1
+        
         stats['facts_processed'] += 1
         return target_fact
         
     except Exception as e:
         if skip_invalid:
-            stats['warnings'].append(
-                f"Level '{level_context}' fact #{source_fact.get('index', '?')}: Error processing - {str(e)}"
-            )
+            record_warning(level_context, source_fact.get('index', '?'), 'error', detail=str(e), diagnostics=diagnostics)
             return None
         else:
             print(f"\n   {Colors.FAIL}❌ Error processing fact #{source_fact.get('index', '?')}: {str(e)}{Colors.ENDC}")
             while True:
                 response = input(f"\n   Skip this fact? (y/n): ").strip().lower()
                 if response in ['y', 'yes']:
-                    stats['warnings'].append(
-                        f"Level '{level_context}' fact #{source_fact.get('index', '?')}: User skipped - error: {str(e)}"
-                    )
+                    record_warning(level_context, source_fact.get('index', '?'), 'user_skipped_error', detail=str(e), diagnostics=diagnostics)
                     return None
                 elif response in ['n', 'no']:
                     print(f"   {Colors.FAIL}Cannot proceed. Aborting conversion.{Colors.ENDC}")
@@ -299,7 +553,91 @@ def map_fact(source_fact, field_mapping, optional_fields, level_context, skip_in
                 else:
                     print(f"   {Colors.FAIL}Please enter 'y' or 'n'{Colors.ENDC}")
 
-def convert_json(input_data, include_all_optional=False, selective_mode=False, skip_invalid_facts=False):
+def init_parallel_worker(job):
+    """Store the level being mapped in a worker process.
+    
+    Passed as the pool initializer so the level's facts reach each worker once:
+    inherited without copying under fork, pickled once per worker under spawn.
+    """
+    global parallel_job
+    parallel_job = job
+
+def map_fact_chunk(chunk):
+    """Map facts [start, end) of the worker's level.
+    
+    Returns the mapped facts (None for skipped ones) in input order, along with
+    the stats this chunk contributed so the parent can merge them. Diagnostics go
+    to the chunk's own file (if any), which the parent appends to the real stream
+    in chunk order; the parent's inherited stream is never touched here.
+    """
+    start, end, diagnostics_path = chunk
+    source_facts, field_mapping, optional_fields, level_context, use_metadata = parallel_job
+    
+    # Workers inherit or re-import the parent's stats; count only this chunk
+    stats['facts_processed'] = 0
+    stats['results_normalized'] = 0
+    stats['warning_counts'] = {}
+    stats['warning_samples'] = {}
+    
+    diagnostics = open(diagnostics_path, 'w', encoding='utf-8') if diagnostics_path else None
+    try:
+        mapped_facts = [
+            map_fact(source_facts[fact_idx], field_mapping, optional_fields, level_context, True, use_metadata, fact_idx, diagnostics)
+            for fact_idx in range(start, end)
+        ]
+    finally:
+        if diagnostics:
+            diagnostics.close()
+    chunk_stats = {
+        'facts_processed': stats['facts_processed'],
+        'results_normalized': stats['results_normalized'],
+        'warning_counts': stats['warning_counts'],
+        'warning_samples': stats['warning_samples'],
+    }
+    return mapped_facts, chunk_stats
+
+def map_facts_parallel(workers, source_facts, field_mapping, optional_fields, level_context, use_metadata):
+    """Map a level's facts across worker processes, preserving the original order.
+    
+    Only valid once the field mapping is fully resolved and skip mode is on, since
+    workers can't prompt. Output and stats match the serial path exactly.
+    
+    Workers get the level once through the pool initializer and each chunk is just
+    a (start, end) range, so only mapped facts travel back over IPC. Unpickling
+    those on the parent stays serial, at about 25-30% of the serial mapping cost,
+    which caps the speedup at roughly 3.5x however many cores are used.
+    """
+    chunk_size = max(PARALLEL_MIN_CHUNK, -(-len(source_facts) // (workers * 4)))
+    job = (source_facts, field_mapping, optional_fields, level_context, use_metadata)
+    
+    # Forked workers inherit the diagnostics file object; flush it first so no
+    # buffered records can be written out a second time from a worker
+    if diagnostics_stream is not None:
+        diagnostics_stream.flush()
+    
+    mapped_facts = []
+    with tempfile.TemporaryDirectory(prefix='insert_data_') as temp_dir:
+        chunks = [
+            (start, min(start + chunk_size, len(source_facts)),
+             os.path.join(temp_dir, f"chunk_{start}.ndjson") if diagnostics_stream is not None else None)
+            for start in range(0, len(source_facts), chunk_size)
+        ]
+        
+        # A pool per level, so forked workers see this level's facts
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_parallel_worker, initargs=(job,)) as executor:
+            # executor.map yields results in submission order, so facts stay in index order
+            for (start, end, diagnostics_path), (chunk_facts, chunk_stats) in zip(chunks, executor.map(map_fact_chunk, chunks)):
+                mapped_facts.extend(chunk_facts)
+                stats['facts_processed'] += chunk_stats['facts_processed']
+                stats['results_normalized'] += chunk_stats['results_normalized']
+                merge_warnings(chunk_stats['warning_counts'], chunk_stats['warning_samples'])
+                if diagnostics_path:
+                    with open(diagnostics_path, 'r', encoding='utf-8') as chunk_diagnostics:
+                        shutil.copyfileobj(chunk_diagnostics, diagnostics_stream)
+                    os.remove(diagnostics_path)
+    return mapped_facts
+
+def convert_json(input_data, include_all_optional=False, selective_mode=False, skip_invalid_facts=False, workers=1):
     """Convert input JSON to target format."""
     print(f"\n{'='*60}")
     print(f"🚀 {Colors.HEADER}{Colors.BOLD}Starting Conversion Process{Colors.ENDC}")
@@ -557,10 +895,17 @@ def convert_json(input_data, include_all_optional=False, selective_mode=False, s
             fact_field_mapping[essential_field] = essential_field
             print(f"   ✅ '{essential_field}' found")
         else:
-            mapped = prompt_user_for_field(essential_field, available_fact_keys, "fact field")
+            # Never map 'result' onto a split field; facts build it from those themselves
+            candidate_keys = available_fact_keys
+            if essential_field == 'result':
+                candidate_keys = [k for k in available_fact_keys if k not in SPLIT_RESULT_FIELDS]
+            mapped = prompt_user_for_field(essential_field, candidate_keys, "fact field")
             if mapped:
                 fact_field_mapping[essential_field] = mapped
                 stats['field_mappings'][f"fact.{essential_field}"] = mapped
+            elif essential_field == 'result' and any(k in available_fact_keys for k in SPLIT_RESULT_FIELDS):
+                fact_field_mapping['result'] = 'result'
+                print(f"   ✅ 'result' will be built from split result fields")
             else:
                 print(f"   {Colors.FAIL}❌ Essential field '{essential_field}' not mapped. Aborting.{Colors.ENDC}")
                 return None
@@ -576,6 +921,15 @@ def convert_json(input_data, include_all_optional=False, selective_mode=False, s
     print(f"\n⚙️  {Colors.OKBLUE}Step 4: Processing levels...{Colors.ENDC}")
     output_levels = []
     
+    # Parallel mapping needs a fully resolved mapping, which skip mode guarantees
+    parallel = False
+    if workers > 1:
+        if not skip_invalid_facts:
+            print(f"   {Colors.WARNING}⚠️  --workers requires --skip-invalid-facts; processing serially{Colors.ENDC}")
+        elif any(len(level.get(level_field_mapping['facts'], [])) >= PARALLEL_MIN_FACTS for level in levels_array):
+            print(f"   ⚡ {Colors.OKCYAN}Mapping large levels with {workers} worker processes{Colors.ENDC}")
+            parallel = True
+    
     for i, source_level in enumerate(levels_array, 1):
         level_id = source_level.get(level_field_mapping.get('id', 'id'), f'Level {i}')
         level_title = source_level.get(level_field_mapping.get('title', 'title'), f'Level {i}')
@@ -602,8 +956,15 @@ def convert_json(input_data, include_all_optional=False, selective_mode=False, s
         source_facts = source_level.get(facts_key, [])
         target_facts = []
         
-        for fact_idx, source_fact in enumerate(source_facts):
-            mapped_fact = map_fact(source_fact, fact_field_mapping, optional_fact_fields, level_title, skip_invalid_facts, use_metadata_field, fact_idx)
+        if parallel and len(source_facts) >= PARALLEL_MIN_FACTS:
+            mapped_facts = map_facts_parallel(workers, source_facts, fact_field_mapping, optional_fact_fields, level_title, use_metadata_field)
+        else:
+            mapped_facts = (
+                map_fact(source_fact, fact_field_mapping, optional_fact_fields, level_title, skip_invalid_facts, use_metadata_field, fact_idx, diagnostics_stream)
+                for fact_idx, source_fact in enumerate(source_facts)
+            )
+        
+        for mapped_fact in mapped_facts:
             if mapped_fact:
                 target_facts.append(mapped_fact)
             else:
@@ -620,6 +981,165 @@ def convert_json(input_data, include_all_optional=False, selective_mode=False, s
     
     return {'levels': output_levels}
 
+# Range of integers SQLite can store natively
+SQLITE_MIN_INT = -2**63
+SQLITE_MAX_INT = 2**63 - 1
+
+# SQLite schema for the exported fact bank. Indexes are created after the bulk
+# insert so they are built once instead of being updated row by row.
+SQLITE_SCHEMA = """
+CREATE TABLE levels (
+    level_key INTEGER PRIMARY KEY,
+    level_id TEXT,
+    title TEXT,
+    objective TEXT,
+    difficulty TEXT,
+    fact_count INTEGER,
+    data TEXT
+);
+
+CREATE TABLE facts (
+    fact_key INTEGER PRIMARY KEY,
+    level_key INTEGER NOT NULL REFERENCES levels(level_key),
+    fact_index INTEGER,
+    type TEXT,
+    operator TEXT,
+    standard TEXT,
+    asking_for TEXT,
+    prompt TEXT,
+    expression TEXT,
+    result,
+    result_value REAL,
+    data TEXT
+);
+
+CREATE TABLE operands (
+    fact_key INTEGER NOT NULL REFERENCES facts(fact_key),
+    position INTEGER NOT NULL,
+    value
+);
+
+CREATE TABLE standards (
+    level_key INTEGER NOT NULL REFERENCES levels(level_key),
+    standard TEXT NOT NULL
+);
+"""
+
+SQLITE_INDEXES = """
+CREATE INDEX idx_levels_level_id ON levels(level_id);
+CREATE INDEX idx_facts_level_key ON facts(level_key);
+CREATE INDEX idx_facts_operator ON facts(operator);
+CREATE INDEX idx_facts_type ON facts(type);
+CREATE INDEX idx_facts_standard ON facts(standard);
+CREATE INDEX idx_operands_fact_key ON operands(fact_key);
+CREATE INDEX idx_standards_standard ON standards(standard);
+CREATE INDEX idx_standards_level_key ON standards(level_key);
+"""
+
+def to_sql_value(value):
+    """Convert a JSON value to something sqlite3 can bind.
+    
+    Nested values become JSON text, as do ints outside SQLite's 64-bit range.
+    """
+    if isinstance(value, int) and not isinstance(value, bool) and not SQLITE_MIN_INT <= value <= SQLITE_MAX_INT:
+        return str(value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+def numeric_result(fact):
+    """Return a fact result as a number for range queries, or None if not numeric."""
+    canonical_result = fact.get('canonical_result')
+    if isinstance(canonical_result, dict):
+        return canonical_result.get('value')
+    result = fact.get('result')
+    if isinstance(result, bool):
+        return None
+    if isinstance(result, (int, float, str)):
+        try:
+            return float(result)
+        except (ValueError, OverflowError):
+            return None
+    return None
+
+def export_sqlite(output_data, db_file):
+    """Export converted levels to a SQLite database, replacing any previous export.
+    
+    All rows are written with bulk inserts inside a single transaction into a
+    temporary file that only replaces db_file once complete, so a failed export
+    leaves the previous database untouched.
+    Returns a (level_count, fact_count) tuple.
+    """
+    level_rows = []
+    fact_rows = []
+    operand_rows = []
+    standard_rows = []
+    
+    for level_key, level in enumerate(output_data.get('levels', []), 1):
+        facts = level.get('facts', [])
+        level_extra = {k: v for k, v in level.items() if k != 'facts'}
+        level_rows.append((
+            level_key,
+            to_sql_value(level.get('id')),
+            to_sql_value(level.get('title')),
+            to_sql_value(level.get('objective')),
+            to_sql_value(level.get('difficulty')),
+            len(facts),
+            json.dumps(level_extra, ensure_ascii=False),
+        ))
+        
+        standards = level.get('standards', [])
+        if isinstance(standards, str):
+            standards = [standards]
+        for standard in standards:
+            standard_rows.append((level_key, str(standard)))
+        
+        for fact in facts:
+            fact_key = len(fact_rows) + 1
+            fact_rows.append((
+                fact_key,
+                level_key,
+                to_sql_value(fact.get('index')),
+                to_sql_value(fact.get('type')),
+                to_sql_value(fact.get('operator')),
+                to_sql_value(fact.get('standard')),
+                to_sql_value(fact.get('asking_for')),
+                to_sql_value(fact.get('prompt')),
+                to_sql_value(fact.get('expression')),
+                to_sql_value(fact.get('result')),
+                numeric_result(fact),
+                json.dumps(fact, ensure_ascii=False),
+            ))
+            operands = fact.get('operands')
+            if isinstance(operands, list):
+                for position, operand in enumerate(operands):
+                    operand_rows.append((fact_key, position, to_sql_value(operand)))
+    
+    temp_file = f"{db_file}.tmp"
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+    
+    try:
+        conn = sqlite3.connect(temp_file)
+        try:
+            conn.executescript(SQLITE_SCHEMA)
+            with conn:
+                conn.executemany("INSERT INTO levels VALUES (?, ?, ?, ?, ?, ?, ?)", level_rows)
+                conn.executemany("INSERT INTO facts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", fact_rows)
+                conn.executemany("INSERT INTO operands VALUES (?, ?, ?)", operand_rows)
+                conn.executemany("INSERT INTO standards VALUES (?, ?)", standard_rows)
+            conn.executescript(SQLITE_INDEXES)
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+        os.replace(temp_file, db_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    
+    return len(level_rows), len(fact_rows)
+
 def print_report():
     """Print a detailed conversion report."""
     print(f"\n{'='*60}")
@@ -629,6 +1149,7 @@ def print_report():
     print(f"\n✅ {Colors.OKGREEN}Success:{Colors.ENDC}")
     print(f"   • Levels processed: {stats['levels_processed']}")
     print(f"   • Facts processed: {stats['facts_processed']}")
+    print(f"   • Results normalized: {stats['results_normalized']}")
     
     if stats['facts_skipped'] > 0:
         print(f"\n⚠️  {Colors.WARNING}Warnings:{Colors.ENDC}")
@@ -639,17 +1160,38 @@ def print_report():
         for target, source in stats['field_mappings'].items():
             print(f"   • {target} ← {source}")
     
-    if stats['warnings']:
-        print(f"\n⚠️  {Colors.WARNING}Detailed Warnings:{Colors.ENDC}")
-        for warning in stats['warnings'][:10]:  # Show first 10
-            print(f"   • {warning}")
-        if len(stats['warnings']) > 10:
-            print(f"   ... and {len(stats['warnings']) - 10} more warnings")
+    if stats['warning_counts']:
+        total_warnings = sum(stats['warning_counts'].values())
+        print(f"\n⚠️  {Colors.WARNING}Warning Summary ({total_warnings} total):{Colors.ENDC}")
+        top_counts = sorted(stats['warning_counts'].items(), key=lambda item: item[1], reverse=True)
+        for (level, reason, field), count in top_counts[:10]:  # Show the 10 most frequent
+            field_note = f" '{field}'" if field else ""
+            print(f"   • {count}× {reason}{field_note} in level '{level}'")
+        if len(top_counts) > 10:
+            print(f"   ... and {len(top_counts) - 10} more (level, reason, field) groups")
+        
+        print(f"\n⚠️  {Colors.WARNING}Sample Warnings:{Colors.ENDC}")
+        for reason, samples in stats['warning_samples'].items():
+            for record in samples:
+                print(f"   • {format_warning(record)}")
+        
+        if diagnostics_stream is not None:
+            print(f"\n📝 Full warning details written to: {diagnostics_stream.name}")
     
     print(f"\n{'='*60}")
 
+def get_option_value(flag):
+    """Return the value following a command-line flag, or None if absent."""
+    if flag in sys.argv:
+        position = sys.argv.index(flag)
+        if position + 1 < len(sys.argv) and not sys.argv[position + 1].startswith('--'):
+            return sys.argv[position + 1]
+    return None
+
 def main():
     """Main entry point."""
+    global diagnostics_stream
+    
     # Parse arguments
     if len(sys.argv) < 3:
         print(f"{Colors.FAIL}❌ Usage: python3 insert_data.py [input_file] [output_file] [options]{Colors.ENDC}")
@@ -658,6 +1200,9 @@ def main():
         print(f"  --wipe-output-file     Replace existing output file instead of merging")
         print(f"  --selective            Review and approve each level individually")
         print(f"  --skip-invalid-facts   Skip facts with missing fields (default: interactive resolution)")
+        print(f"  --sqlite [db_file]     Also export the converted data to a SQLite database (see query_data.py)")
+        print(f"  --workers [N]          Map facts of large levels in N worker processes (requires --skip-invalid-facts)")
+        print(f"  --diagnostics [file]   Stream every warning to an NDJSON diagnostics file")
         sys.exit(1)
     
     input_file = sys.argv[1]
@@ -666,6 +1211,25 @@ def main():
     wipe_output = '--wipe-output-file' in sys.argv or '--wipe_output_file' in sys.argv
     selective_mode = '--selective' in sys.argv
     skip_invalid_facts = '--skip-invalid-facts' in sys.argv
+    sqlite_file = get_option_value('--sqlite')
+    if '--sqlite' in sys.argv and not sqlite_file:
+        print(f"{Colors.FAIL}❌ --sqlite requires a database file path{Colors.ENDC}")
+        sys.exit(1)
+    workers = 1
+    if '--workers' in sys.argv:
+        workers_value = get_option_value('--workers')
+        try:
+            workers = int(workers_value) if workers_value else (os.cpu_count() or 1)
+        except ValueError:
+            print(f"{Colors.FAIL}❌ --workers expects a number, got '{workers_value}'{Colors.ENDC}")
+            sys.exit(1)
+        if workers < 1:
+            print(f"{Colors.FAIL}❌ --workers must be at least 1, got {workers}{Colors.ENDC}")
+            sys.exit(1)
+    diagnostics_file = get_option_value('--diagnostics')
+    if '--diagnostics' in sys.argv and not diagnostics_file:
+        print(f"{Colors.FAIL}❌ --diagnostics requires a file path{Colors.ENDC}")
+        sys.exit(1)
     
     # Load input file
     print(f"\n📂 Loading input file: {input_file}")
@@ -707,8 +1271,16 @@ def main():
     elif wipe_output and Path(output_file).exists():
         print(f"\n🗑️  {Colors.WARNING}Wiping existing output file: {output_file}{Colors.ENDC}")
     
+    # Open diagnostics stream so warnings go to disk instead of memory
+    if diagnostics_file:
+        try:
+            diagnostics_stream = open(diagnostics_file, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"{Colors.FAIL}❌ Cannot open diagnostics file: {e}{Colors.ENDC}")
+            sys.exit(1)
+    
     # Convert
-    output_data = convert_json(input_data, include_all, selective_mode, skip_invalid_facts)
+    output_data = convert_json(input_data, include_all, selective_mode, skip_invalid_facts, workers)
     
     if output_data is None:
         print(f"\n{Colors.FAIL}❌ Conversion failed. No output file created.{Colors.ENDC}")
@@ -733,9 +1305,22 @@ def main():
         print(f"   {Colors.FAIL}❌ Error saving file: {e}{Colors.ENDC}")
         sys.exit(1)
     
+    # Export SQLite database
+    if sqlite_file:
+        print(f"\n🗄️  {Colors.OKBLUE}Exporting SQLite database: {sqlite_file}{Colors.ENDC}")
+        try:
+            level_count, fact_count = export_sqlite(output_data, sqlite_file)
+            print(f"   ✅ Exported {level_count} level(s) and {fact_count} fact(s)")
+        except (sqlite3.Error, OSError, OverflowError) as e:
+            print(f"   {Colors.FAIL}❌ Error exporting database: {e}{Colors.ENDC}")
+            sys.exit(1)
+    
     # Print report
     print_report()
     
+    if diagnostics_stream is not None:
+        diagnostics_stream.close()
+    
     print(f"\n🎉 {Colors.OKGREEN}{Colors.BOLD}Conversion complete!{Colors.ENDC}")
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Query Data - SQLite Fact Bank Query Tool
+Runs queries against a database exported with `insert_data.py --sqlite`.
+
+Usage: python3 query_data.py [db_file] [sql | preset] [args...]
+
+Presets:
+  summary                    Level, fact and standard counts
+  levels                     List levels with their fact counts
+  operator [op] [min]        Facts with an operator, optionally with result > min
+  standards-below [count]    Level standards covered by fewer than [count] facts
+                             (every fact in a level counts toward each of its standards)
+  fact-standards-below [count]
+                             Per-fact standards (facts.standard) with fewer than [count] facts
+
+Any other argument is executed as SQL, e.g.:
+  python3 query_data.py bank.db "SELECT operator, COUNT(*) FROM facts GROUP BY operator"
+
+Tables: levels, facts, operands, standards
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+# ANSI color codes for terminal output
+class Colors:
+    HEADER = '\033[95m'
+    OKBLUE = '\033[94m'
+    OKCYAN = '\033[96m'
+    OKGREEN = '\033[92m'
+    WARNING = '\033[93m'
+    FAIL = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+# Preset queries: name -> (sql, number of required args, number of optional args)
+PRESETS = {
+    'summary': ("""
+        SELECT
+            (SELECT COUNT(*) FROM levels) AS levels,
+            (SELECT COUNT(*) FROM facts) AS facts,
+            (SELECT COUNT(DISTINCT standard) FROM standards) AS standards
+    """, 0, 0),
+    'levels': ("""
+        SELECT level_id, title, fact_count
+        FROM levels
+        ORDER BY level_key
+    """, 0, 0),
+    'operator': ("""
+        SELECT l.level_id, f.fact_index, f.expression, f.result
+        FROM facts f JOIN levels l ON l.level_key = f.level_key
+        WHERE f.operator = ? AND (? IS NULL OR f.result_value > ?)
+        ORDER BY f.level_key, f.fact_key
+    """, 1, 1),
+    'standards-below': ("""
+        SELECT s.standard, COUNT(f.fact_key) AS fact_count
+        FROM standards s LEFT JOIN facts f ON f.level_key = s.level_key
+        GROUP BY s.standard
+        HAVING fact_count < ?
+        ORDER BY fact_count, s.standard
+    """, 1, 0),
+    'fact-standards-below': ("""
+        SELECT standard, COUNT(*) AS fact_count
+        FROM facts
+        WHERE standard IS NOT NULL
+        GROUP BY standard
+        HAVING fact_count < ?
+        ORDER BY fact_count, standard
+    """, 1, 0),
+}
+
+def preset_params(name, args):
+    """Build the bound parameters for a preset query."""
+    if name == 'operator':
+        minimum = float(args[1]) if len(args) > 1 else None
+        return (args[0], minimum, minimum)
+    if name in ('standards-below', 'fact-standards-below'):
+        return (int(args[0]),)
+    return ()
+
+def print_rows(columns, rows):
+    """Print query results as an aligned table."""
+    if not rows:
+        print(f"{Colors.WARNING}(no rows){Colors.ENDC}")
+        return
+    
+    cells = [["" if value is None else str(value) for value in row] for row in rows]
+    widths = [len(column) for column in columns]
+    for row in cells:
+        for i, value in enumerate(row):
+            widths[i] = min(max(widths[i], len(value)), 60)
+    
+    header = "  ".join(column.ljust(widths[i]) for i, column in enumerate(columns))
+    print(f"{Colors.BOLD}{header}{Colors.ENDC}")
+    print("  ".join('─' * width for width in widths))
+    for row in cells:
+        print("  ".join(
+            (value if len(value) <= widths[i] else value[:widths[i] - 3] + "...").ljust(widths[i])
+            for i, value in enumerate(row)
+        ))
+    print(f"\n{Colors.OKCYAN}{len(rows)} row(s){Colors.ENDC}")
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    
+    db_file = sys.argv[1]
+    query = sys.argv[2]
+    args = sys.argv[3:]
+    
+    if not Path(db_file).exists():
+        print(f"{Colors.FAIL}❌ Database not found: {db_file}{Colors.ENDC}")
+        sys.exit(1)
+    
+    if query in PRESETS:
+        sql, required, optional = PRESETS[query]
+        if not required <= len(args) <= required + optional:
+            print(f"{Colors.FAIL}❌ Preset '{query}' takes {required}-{required + optional} argument(s){Colors.ENDC}")
+            sys.exit(1)
+        try:
+            params = preset_params(query, args)
+        except ValueError as e:
+            print(f"{Colors.FAIL}❌ Invalid argument: {e}{Colors.ENDC}")
+            sys.exit(1)
+    else:
+        sql = query
+        params = args
+    
+    # Open read-only so ad-hoc queries can't modify the exported bank
+    conn = sqlite3.connect(f"{Path(db_file).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(sql, params)
+        columns = [description[0] for description in cursor.description or []]
+        rows = cursor.fetchall()
+    except sqlite3.Error as e:
+        print(f"{Colors.FAIL}❌ Query failed: {e}{Colors.ENDC}")
+        sys.exit(1)
+    finally:
+        conn.close()
+    
+    print_rows(columns, rows)
+
+if __name__ == "__main__":
+    main()